@@ -0,0 +1,45 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+# distutils: extra_compile_args = -O3 -ffast-math -fopenmp
+# distutils: extra_link_args = -fopenmp
+# distutils: libraries = m
+
+# Typed C versions of the Antoine kernels for users without numba,
+# build in place with cythonize -i chemeos/_antoine.pyx
+
+from cython.parallel cimport prange
+from libc.math cimport exp
+
+cdef double LN10 = 2.302585092994046
+
+cdef inline double antoine_eval(double coeff_a_val, double coeff_b_val, double coeff_c_val,\
+    double temp, bint is_log10) noexcept nogil:
+    """Saturation pressure from Antoine coefficients A, B and C at temp."""
+
+    cdef double exponent = coeff_a_val - coeff_b_val/(coeff_c_val + temp)
+
+    if is_log10:
+
+        return exp(exponent*LN10)
+
+    return exp(exponent)
+
+def sat_p(double coeff_a_val, double coeff_b_val, double coeff_c_val, double temp,\
+    bint is_log10 = True):
+    """Saturation pressure from Antoine coefficients A, B and C at temp."""
+
+    return antoine_eval(coeff_a_val,coeff_b_val,coeff_c_val,temp,is_log10)
+
+def batch_sat_p(const double[::1] coeff_a_vals, const double[::1] coeff_b_vals,\
+    const double[::1] coeff_c_vals, const double[::1] temps, double[::1] out,\
+    bint is_log10 = True):
+    """Writes the saturation pressure of each temperature into out.
+
+    All arrays must be contiguous float64 of the same length, the inputs may be
+    read-only. The loop runs without the GIL and is split across threads with OpenMP.
+    """
+
+    cdef Py_ssize_t i, n = temps.shape[0]
+
+    for i in prange(n, nogil=True):
+
+        out[i] = antoine_eval(coeff_a_vals[i],coeff_b_vals[i],coeff_c_vals[i],temps[i],is_log10)
@@ -0,0 +1,44 @@
+import math
+import os
+
+from numba.pycc import CC
+
+# Ahead of time compiles the Antoine kernels into the chemeos._antoine_c extension,
+# run with python -m chemeos._compile_aot, requires numba only at build time.
+# The kernels are for callers that want compiled per element evaluation without
+# numba at runtime, saturation_pressure does not use them as their serial loops are
+# slower than numpy's vectorized exp on arrays and than math on scalars.
+
+cc = CC('_antoine_c')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+@cc.export('sat_p_log10','f8(f8,f8,f8,f8)')
+def sat_p_log10(coeff_a_val,coeff_b_val,coeff_c_val,temp):
+    """Saturation pressure for coefficients fit with log base 10."""
+
+    return 10.0**(coeff_a_val - coeff_b_val/(coeff_c_val + temp))
+
+@cc.export('sat_p_ln','f8(f8,f8,f8,f8)')
+def sat_p_ln(coeff_a_val,coeff_b_val,coeff_c_val,temp):
+    """Saturation pressure for coefficients fit with the natural log."""
+
+    return math.exp(coeff_a_val - coeff_b_val/(coeff_c_val + temp))
+
+@cc.export('sat_p_many','void(f8[:],f8[:],f8[:],f8[:],f8[:])')
+def sat_p_many(coeff_a_vals,coeff_b_vals,coeff_c_vals,temps,out):
+    """Writes the log base 10 saturation pressure of each temperature into out."""
+
+    for i in range(temps.shape[0]):
+
+        out[i] = 10.0**(coeff_a_vals[i] - coeff_b_vals[i]/(coeff_c_vals[i] + temps[i]))
+
+@cc.export('sat_p_many_ln','void(f8[:],f8[:],f8[:],f8[:],f8[:])')
+def sat_p_many_ln(coeff_a_vals,coeff_b_vals,coeff_c_vals,temps,out):
+    """Writes the natural log saturation pressure of each temperature into out."""
+
+    for i in range(temps.shape[0]):
+
+        out[i] = math.exp(coeff_a_vals[i] - coeff_b_vals[i]/(coeff_c_vals[i] + temps[i]))
+
+if __name__ == "__main__":
+    cc.compile()
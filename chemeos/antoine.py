@@ -1,18 +1,51 @@
+import bisect
+import math
+from dataclasses import dataclass
+
 import numpy as np
 
+# Cython kernels, built with cythonize -i chemeos/_antoine.pyx.
+try:
+    from chemeos._antoine import batch_sat_p
+except ImportError:
+    batch_sat_p = None
+
 _LOG10 = "log base 10"
 _LN = "natural log"
 
-# Global variables used as keys used in AntoineCoefficientLib
-_COEFF_A_KEY = 'A'
-_COEFF_B_KEY = 'B'
-_COEFF_C_KEY = 'C'
+# 10**x is evaluated as exp(x*ln(10)) on arrays, a single transcendental per element.
+_LN10 = math.log(10.0)
+
+# Python number types _log evaluates with the math module, checked with type() as it is cheap.
+_PY_SCALARS = (float, int)
+
+# Maximum number of (species_name, temperature) lookups memoized by get_coeffs.
+_COEFF_CACHE_SIZE = 4096
 
-# Temperature limit keys
-_UPPER_TEMPERATURE_LIMIT_KEY = "UTL"
-_LOWER_TEMPERATURE_LIMIT_KEY = "LTL"
+# Initial number of rows allocated for the coefficient arrays, doubled when full.
+_INITIAL_CAPACITY = 16
 
-# Global string variables to denote pressure units.
+@dataclass(slots=True, frozen=True)
+class AntoineRecord:
+    """One set of Antoine coefficients and the temperature range they are valid over.
+
+    Fields
+        A : float
+            Antoine coefficient A.
+        B : float
+            Antoine coefficient B.
+        C : float
+            Antoine coefficient C.
+        Tlo : float
+            The lower temperature limit of the coefficients.
+        Thi : float
+            The upper temperature limit of the coefficients.
+    """
+    A: float
+    B: float
+    C: float
+    Tlo: float
+    Thi: float
 
 class SpeciesNotFound(ValueError):
     """Error raised when search for species_name in dictionary fails."""
@@ -20,7 +53,28 @@ class SpeciesNotFound(ValueError):
 class TemperatureOutOfRange(ValueError):
     """Error raised when temperature argument is out of range."""
 
-def saturation_pressure(coeff_a_val,coeff_b_val,coeff_c_val, temp,is_log10 = True):
+def _kernel_ready(arrays):
+    """Returns True if every array is a C contiguous float64 ndarray of the same shape,\
+     so the compiled kernels can read them without copying."""
+
+    shape = arrays[-1].shape
+
+    return all(isinstance(arr,np.ndarray) and arr.dtype == np.float64 and\
+        arr.shape == shape and arr.flags.c_contiguous for arr in arrays)
+
+def _compiled_saturation_pressure(coeff_a_val,coeff_b_val,coeff_c_val,temp,is_log10):
+    """Evaluates kernel ready array arguments with the multithreaded Cython kernel."""
+
+    flat = [arr.ravel() for arr in (coeff_a_val,coeff_b_val,coeff_c_val,temp)]
+
+    out = np.empty(flat[3].shape, dtype=np.float64)
+
+    batch_sat_p(*flat,out,bool(is_log10))
+
+    return out.reshape(temp.shape)
+
+def saturation_pressure(coeff_a_val,coeff_b_val,coeff_c_val, temp,is_log10 = True,\
+    dtype = None):
     """Given Antoine values A, B and C, and the temperature; returns the saturation pressure.
 
     Parameters
@@ -28,29 +82,127 @@ def saturation_pressure(coeff_a_val,coeff_b_val,coeff_c_val, temp,is_log10 = Tru
         - coeff_b_val is Antoine coefficient B.
         - coeff_c_val is Antoine coefficient C.
         - temp is the temperature
+        - dtype is the floating point type the evaluation is done in, by default
+            np.float64. np.float32 halves memory traffic and doubles SIMD width for
+            large arrays. Its relative error (a few 1e-6) is negligible next to the
+            error of the Antoine fit itself.
     Note: It is the users responsibility to ensure units are consistent.
+    Note: All arguments may be array-like, they are broadcast against each other
+        so many temperatures (and/or coefficient sets) can be evaluated in one call.
+    Note: Scalar arguments are evaluated with the math module to avoid numpy's
+        dispatch overhead. When the coefficients and temperature are all contiguous
+        float64 arrays of the same shape they are evaluated by the Cython extension
+        chemeos._antoine if it has been built. Anything else, such as scalar
+        coefficients with an array of temperatures, is evaluated by numpy which
+        broadcasts without copying. The numba kernels in chemeos.numba are not used
+        here, import that module directly to use them.
     """
 
+    exponent = None
+
+    if type(temp) is float or type(temp) is int:
+
+        try:
+
+            exponent = coeff_a_val - coeff_b_val/(coeff_c_val + temp)
+
+        except TypeError:
+
+            # Sequence coefficients such as lists are handled by numpy below.
+            pass
+
+    # Only plain Python numbers give a float exponent, anything involving numpy falls through.
+    if type(exponent) is float and dtype is None:
+
+        if is_log10:
+
+            return 10.0**exponent
+
+        return math.exp(exponent)
+
+    if dtype is None:
+
+        dtype = np.float64
+
+    is_float64 = dtype is np.float64 or np.dtype(dtype) == np.float64
+
+    if not is_float64:
+
+        coeff_a_val = np.asarray(coeff_a_val, dtype=dtype)
+        coeff_b_val = np.asarray(coeff_b_val, dtype=dtype)
+        coeff_c_val = np.asarray(coeff_c_val, dtype=dtype)
+
+    temp = np.asarray(temp, dtype=dtype)
+
+    if is_float64 and batch_sat_p is not None and\
+        _kernel_ready((coeff_a_val,coeff_b_val,coeff_c_val,temp)):
+
+        return _compiled_saturation_pressure(coeff_a_val,coeff_b_val,coeff_c_val,temp,is_log10)
+
     exponent = coeff_a_val - coeff_b_val/(coeff_c_val + temp)
 
-    if is_log10 is True:
+    if is_log10:
+
+        return np.exp(exponent*_LN10)
+
+    return np.exp(exponent)
+
+def _pow10(exponent):
+    """Returns 10 raised to the scalar exponent."""
+
+    return math.pow(10.0, exponent)
+
+def _pow10_array(exponent):
+    """Returns 10 raised to the array exponent."""
+
+    return np.exp(exponent*_LN10)
 
-        return 10**exponent
+def _first_covering(temperature,lower,upper,overlapping):
+    """Returns the index of the first range covering each temperature and a mask of\
+     which temperatures are covered at all.
 
-    return np.e**exponent
+    Parameters
+        - temperature: an array of temperatures.
+        - lower, upper: 1-D arrays of the lower and upper limits of the ranges, in the
+            order they are preferred.
+        - overlapping: False if no two ranges overlap and lower is sorted, the range
+            is then found with a binary search. Otherwise every range is checked.
+    Note: The index of an uncovered temperature is 0, check the mask before using it.
+    """
+
+    if not overlapping:
+
+        position = np.searchsorted(lower,temperature,side='right') - 1
+        index = np.maximum(position,0)
+
+        valid = (position >= 0) & (temperature <= upper[index])
+
+        return index, valid
+
+    covers = (temperature[...,None] >= lower) & (temperature[...,None] <= upper)
 
-def _check_temperature(temperature,dct):
+    return np.argmax(covers,axis=-1), np.any(covers,axis=-1)
+
+def _check_temperature(temperature,rec):
         """Checks temperature to ensure it is within range.
 
         Parameters
-            - temperature
-            - dct: looks for the temperature range in the dictionary
+            - temperature: a scalar or an array of temperatures.
+            - rec: looks for the temperature range in the AntoineRecord
                 and checks if temperature is within the range. Returns
-                True bool is it is in the range, False if it is not.
+                True bool is it is in the range, False if it is not. For an
+                array of temperatures a boolean array is returned.
         """
 
-        return bool(temperature >= dct[_LOWER_TEMPERATURE_LIMIT_KEY] and\
-            temperature <= dct[_UPPER_TEMPERATURE_LIMIT_KEY])
+        return (temperature >= rec.Tlo) & (temperature <= rec.Thi)
+
+def _grow_array(arr,capacity):
+    """Returns a copy of arr with room for capacity rows, the new rows are uninitialized."""
+
+    grown = np.empty((capacity,) + arr.shape[1:], dtype=arr.dtype)
+    grown[:arr.shape[0]] = arr
+
+    return grown
 
 
 class AntoineCoefficientLib:
@@ -67,32 +219,101 @@ class AntoineCoefficientLib:
         pressure_units : str
             The pressure units used for the coefficients.
         antoine_coeff_lib : dictionary
-            {species_name:{'A':coeff_a_val,
-            'B': coeff_b_val,
-            'C':coeff_c_val,
-            "upper temperature limit":upper_temperature_limit_val,
-            "lower temperature limit":lower_temperature_limit_val}}
+            {species_name:[AntoineRecord(coeff_a_val,coeff_b_val,coeff_c_val,
+            lower_temperature_limit_val,upper_temperature_limit_val), ...]}
         is_log10 : boolean
             If true calculations done with log base 10, otherwise natural log is used.
 
+    Notes
+        - Each species' sets of coefficients are kept in the order they were added. Where
+            ranges overlap the set added first is used.
+        - The coefficients are also stored as parallel numpy arrays (struct of arrays),
+            _species_rows maps a species name to a list of its row indices in those arrays.
+            These are used for vectorized evaluation over arrays of temperatures.
+
     """
+    __slots__ = ('source','temperature_units','pressure_units','antoine_coeff_lib',\
+        '_is_log10','_base_fn','_base_ufunc','_species_rows','_species_index',\
+        '_tlo_by_species','_records_by_tlo','_overlapping','_size',\
+        '_A','_B','_C','_Tlo','_Thi','_coeff_cache')
+
     def __init__(self,temperature_units,pressure_units,source,is_log10 = True):
 
         self.source = source
         self.temperature_units = temperature_units
         self.pressure_units = pressure_units
         self.antoine_coeff_lib = {}
-        self.is_log10 = is_log10
+        self.is_log10 = is_log10  # Also sets _base_fn and _base_ufunc.
+
+        self._species_rows = {}
+
+        # Index arrays built from _species_rows on first vectorized use, see _species_arrays.
+        self._species_index = {}
+
+        # Each species' lower temperature limits sorted, with the records in the same order.
+        self._tlo_by_species = {}
+        self._records_by_tlo = {}
+
+        # Species with overlapping (or nested) ranges, their lookups cannot rely on bisect alone.
+        self._overlapping = set()
+
+        # Rows past _size are spare capacity.
+        self._size = 0
+        self._A = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._B = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._C = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._Tlo = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._Thi = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+
+        # Memoized scalar lookups, {(species_name, float(temperature)): AntoineRecord}.
+        self._coeff_cache = {}
+
+    @property
+    def is_log10(self):
+        """If true calculations done with log base 10, otherwise natural log is used."""
+
+        return self._is_log10
+
+    @is_log10.setter
+    def is_log10(self,is_log10):
+
+        self._is_log10 = is_log10
+
+        # Choose the exponential once so evaluations do not branch on the log base.
+        if is_log10:
+
+            self._base_fn = _pow10
+            self._base_ufunc = _pow10_array
+
+        else:
+
+            self._base_fn = math.exp
+            self._base_ufunc = np.exp
 
     def _log(self,val):
         """ If _log10 is true, returns log base 10 of value, otherwise returns\
          the natural log of value."""
 
-        if self.is_log10 is True:
+        if type(val) in _PY_SCALARS:
+
+            return math.log10(val) if self.is_log10 else math.log(val)
+
+        if self.is_log10:
 
             return np.log10(val)
 
-        return np.ln(val)
+        return np.log(val)
+
+    def _grow(self):
+        """Doubles the capacity of the coefficient arrays so appends are amortized O(1)."""
+
+        capacity = 2*self._A.shape[0]
+
+        self._A = _grow_array(self._A,capacity)
+        self._B = _grow_array(self._B,capacity)
+        self._C = _grow_array(self._C,capacity)
+        self._Tlo = _grow_array(self._Tlo,capacity)
+        self._Thi = _grow_array(self._Thi,capacity)
 
     def add_coefficients(self,species_name,coeff_a_val,coeff_b_val,coeff_c_val,\
         lower_temperature_limit_val,upper_temperature_limit_val):
@@ -122,45 +343,132 @@ class AntoineCoefficientLib:
 
         """
 
-        new_item = {_COEFF_A_KEY:coeff_a_val,_COEFF_B_KEY:coeff_b_val,\
-        _COEFF_C_KEY:coeff_c_val,_LOWER_TEMPERATURE_LIMIT_KEY\
-        :lower_temperature_limit_val,_UPPER_TEMPERATURE_LIMIT_KEY\
-        :upper_temperature_limit_val}
+        new_item = AntoineRecord(coeff_a_val,coeff_b_val,coeff_c_val,\
+            lower_temperature_limit_val,upper_temperature_limit_val)
+
+        self._coeff_cache.clear()
+
+        if self._size == self._A.shape[0]:
+
+            self._grow()
+
+        new_row = self._size
+        self._size += 1
+
+        self._A[new_row] = coeff_a_val
+        self._B[new_row] = coeff_b_val
+        self._C[new_row] = coeff_c_val
+        self._Tlo[new_row] = lower_temperature_limit_val
+        self._Thi[new_row] = upper_temperature_limit_val
 
         if species_name in self.antoine_coeff_lib:
 
+            tlos = self._tlo_by_species[species_name]
+            records = self._records_by_tlo[species_name]
+
+            position = bisect.bisect_right(tlos,lower_temperature_limit_val)
+
+            # The existing ranges do not overlap, so the new one can only overlap one of
+            # its neighbours in the sorted order.
+            if (position > 0 and records[position - 1].Thi >= lower_temperature_limit_val) or\
+                (position < len(records) and records[position].Tlo <= upper_temperature_limit_val):
+
+                self._overlapping.add(species_name)
+
+            tlos.insert(position,lower_temperature_limit_val)
+            records.insert(position,new_item)
             self.antoine_coeff_lib[species_name].append(new_item)
+            self._species_rows[species_name].append(new_row)
+            self._species_index.pop(species_name,None)
 
         else:
 
+            self._tlo_by_species[species_name] = [lower_temperature_limit_val]
+            self._records_by_tlo[species_name] = [new_item]
             self.antoine_coeff_lib[species_name] = [new_item]
+            self._species_rows[species_name] = [new_row]
 
 
     def get_coeffs(self,species_name,temperature):
-        """Returns a dictionary with antoine cofficients A, B and C; lower \
+        """Returns an AntoineRecord with antoine cofficients A, B and C; lower \
         tempurature limit, and upper temperature limit.
 
-        Dictionary keys
+        Record fields
+
+            - coefficient A is rec.A.
+            - coefficient B is rec.B.
+            - coefficient C is rec.C.
+            - the lower temperature limit is rec.Tlo
+            - the upper temperature limit is rec.Thi
 
-            - key to get coefficient A is 'A'.
-            - key to get coefficient A is 'B'.
-            - key to get coefficient A is 'C'.
-            - key to get the lower temperature limit is "lower temperature limit"
-            - key to get the upper temperature limit is "upper temperature limit"
+        Lookups are memoized on (species_name, temperature), the cache is cleared
+        whenever coefficients are added.
 
         """
 
-        if species_name not in self.antoine_coeff_lib:
+        return self._resolve(species_name,temperature)
+
+    def _resolve(self,species_name,temperature):
+        """Returns the AntoineRecord of species_name covering temperature.
+
+        The single internal lookup used by the scalar getters, on a cache hit it costs
+        one hash. Raises SpeciesNotFound or TemperatureOutOfRange.
+        """
+
+        temperature = float(temperature)
+        key = (species_name,temperature)
+
+        rec = self._coeff_cache.get(key)
+
+        if rec is not None:
+
+            return rec
+
+        try:
 
-            raise SpeciesNotFound(species_name + " is not in this dictionary")
+            rec = self._find_coeffs(species_name,temperature)
 
-        coeffs = self.antoine_coeff_lib[species_name]
+        except KeyError:
 
-        for dct in coeffs:
+            raise SpeciesNotFound(str(species_name) + " is not in this dictionary") from None
 
-            if _check_temperature(temperature,dct) is True:
+        # Bound the cache, starting over is cheap compared to tracking recency.
+        if len(self._coeff_cache) >= _COEFF_CACHE_SIZE:
+
+            self._coeff_cache.clear()
+
+        self._coeff_cache[key] = rec
+
+        return rec
+
+    def _find_coeffs(self,species_name,temperature):
+        """Uncached search for the coefficients of species_name covering temperature.
+
+        Raises KeyError if species_name is not in the dictionary.
+        """
+
+        tlos = self._tlo_by_species[species_name]
+
+        if species_name in self._overlapping:
+
+            # Several ranges may cover temperature, the set added first is used.
+            for rec in self.antoine_coeff_lib[species_name]:
+
+                if _check_temperature(temperature,rec):
+
+                    return rec
+
+        else:
 
-                return dct
+            position = bisect.bisect_right(tlos,temperature) - 1
+
+            if position >= 0:
+
+                rec = self._records_by_tlo[species_name][position]
+
+                if _check_temperature(temperature,rec):
+
+                    return rec
 
         raise TemperatureOutOfRange("There is no availible set of coefficients\
          with a temperature range " + str(temperature) + " " + str(self.temperature_units) +\
@@ -169,33 +477,280 @@ class AntoineCoefficientLib:
     def get_a(self,species_name,temperature):
         """ Returns coefficnet A if the temperature is within range."""
 
-        return self.get_coeffs(species_name,temperature)[_COEFF_A_KEY]
+        return self._resolve(species_name,temperature).A
 
     def get_b(self,species_name,temperature):
         """ Returns coefficnet B is the temperature is within range."""
 
-        return self.get_coeffs(species_name,temperature)[_COEFF_B_KEY]
+        return self._resolve(species_name,temperature).B
 
     def get_c(self,species_name,temperature):
         """ Returns coefficnet C is the temperature is within range."""
 
-        return self.get_coeffs(species_name,temperature)[_COEFF_C_KEY]
+        return self._resolve(species_name,temperature).C
+
+    def _species_arrays(self,species_name):
+        """Returns the row indices of species_name as an array, with the lower and\
+         upper temperature limits of those rows.
+
+        The rows are in the order they were added for species with overlapping ranges,
+        otherwise they are sorted by lower limit for _first_covering. Built on first use
+        and kept until coefficients are added to the species.
+        Raises KeyError if species_name is not in the dictionary.
+        """
+
+        arrays = self._species_index.get(species_name)
+
+        if arrays is None:
+
+            rows = np.array(self._species_rows[species_name], dtype=np.intp)
+
+            if species_name not in self._overlapping:
+
+                rows = rows[np.argsort(self._Tlo[rows], kind='stable')]
+
+            arrays = (rows, self._Tlo[rows], self._Thi[rows])
+            self._species_index[species_name] = arrays
+
+        return arrays
+
+    def _covering_rows(self,species_name,temperature):
+        """Returns the row index of the coefficients to use for each temperature\
+         in the array temperature, and a mask of which temperatures are covered.
+
+        The single row selection used by every vectorized path, where ranges overlap
+        the set added first is used as in get_coeffs.
+        """
+
+        rows, lower, upper = self._species_arrays(species_name)
+
+        position, valid = _first_covering(temperature,lower,upper,\
+            species_name in self._overlapping)
+
+        return rows[position], valid
+
+    def _select_rows(self,species_name,temperature):
+        """Returns the row index of the coefficients to use for each temperature\
+         in the array temperature.
+
+        Raises TemperatureOutOfRange if any temperature is not covered by a set of coefficients.
+        """
+
+        selected, valid = self._covering_rows(species_name,temperature)
+
+        if not np.all(valid):
+
+            raise TemperatureOutOfRange("There is no availible set of coefficients\
+             with a temperature range " + str(temperature[~valid]) + " " +\
+             str(self.temperature_units) + " is within the bounds of.")
+
+        return selected
 
     def get_saturation_pressure(self,species_name,temperature):
         """If species is in dictionary and temperature is within range,\
-         returns saturation pressure."""
+         returns saturation pressure.
+
+        temperature may be an array, in which case an array of saturation pressures
+        is returned, each evaluated with the coefficients whose range covers it.
+        """
+
+        # np.ndim is slow, so plain Python and numpy scalars are recognised first.
+        if type(temperature) is float or type(temperature) is int or\
+            isinstance(temperature,np.generic) or np.ndim(temperature) == 0:
+
+            rec = self._resolve(species_name,temperature)
+
+            return self._base_fn(rec.A - rec.B/(rec.C + temperature))
+
+        if species_name not in self.antoine_coeff_lib:
+            raise SpeciesNotFound(str(species_name) + " is not in this dictionary")
+
+        temperature = np.asarray(temperature, dtype=np.float64)
+
+        selected = self._select_rows(species_name,temperature)
+
+        return saturation_pressure(self._A[selected],self._B[selected],\
+            self._C[selected],temperature,self.is_log10)
+
+    def make_evaluator(self,species_name):
+        """Returns a function of temperature which evaluates the saturation pressure\
+         of species_name.
+
+        The species lookup is done once here, the returned function closes over
+        the species' coefficients and temperature limits so repeated calls only do
+        the evaluation. It accepts a scalar or an array of temperatures and returns
+        nan for any temperature that is out of range.
+
+        Note: The evaluator is a snapshot, coefficients added to the library after it
+            is made are not seen by it.
+        """
 
         if species_name not in self.antoine_coeff_lib:
-            raise SpeciesNotFound()
+            raise SpeciesNotFound(str(species_name) + " is not in this dictionary")
+
+        rows, lower, upper = self._species_arrays(species_name)
+
+        coeff_a = self._A[rows]
+        coeff_b = self._B[rows]
+        coeff_c = self._C[rows]
+        overlapping = species_name in self._overlapping
+        single = rows.shape[0] == 1
+        base_fn = self._base_fn
+        base_ufunc = self._base_ufunc
+
+        # Python floats for plain Python temperatures, which skip numpy entirely.
+        a_vals, b_vals, c_vals = coeff_a.tolist(), coeff_b.tolist(), coeff_c.tolist()
+        lower_vals, upper_vals = lower.tolist(), upper.tolist()
+        ranges = list(zip(lower_vals,upper_vals,a_vals,b_vals,c_vals))
+
+        def evaluator(temperature):
+            """Saturation pressure of the species at temperature, nan if out of range."""
+
+            if type(temperature) is float or type(temperature) is int:
+
+                if overlapping:
+
+                    for lower_val, upper_val, a_val, b_val, c_val in ranges:
+
+                        if lower_val <= temperature <= upper_val:
+
+                            return base_fn(a_val - b_val/(c_val + temperature))
+
+                    return math.nan
+
+                position = bisect.bisect_right(lower_vals,temperature) - 1
+
+                if position >= 0 and temperature <= upper_vals[position]:
+
+                    return base_fn(a_vals[position] - b_vals[position]/\
+                        (c_vals[position] + temperature))
+
+                return math.nan
+
+            temp = np.asarray(temperature, dtype=np.float64)
+
+            if single:
+
+                # No selection is needed, the coefficients broadcast as scalars.
+                valid = (temp >= lower_vals[0]) & (temp <= upper_vals[0])
+                a_sel, b_sel, c_sel = a_vals[0], b_vals[0], c_vals[0]
+
+            else:
+
+                index, valid = _first_covering(temp,lower,upper,overlapping)
+                a_sel, b_sel, c_sel = coeff_a[index], coeff_b[index], coeff_c[index]
+
+            if valid.all():
+
+                return base_ufunc(a_sel - b_sel/(c_sel + temp))[()]
+
+            # Only in range points are evaluated, so out of range ones cannot warn.
+            if not single:
+
+                a_sel, b_sel, c_sel = a_sel[valid], b_sel[valid], c_sel[valid]
+
+            pressure = np.full(temp.shape,np.nan)
+            pressure[valid] = base_ufunc(a_sel - b_sel/(c_sel + temp[valid]))
+
+            return pressure[()]
+
+        return evaluator
+
+    def compile_evaluator(self,species_name,temperature = None):
+        """Returns a numba JIT compiled function of a scalar temperature which\
+         evaluates the saturation pressure of species_name.
+
+        One set of coefficients is baked into the compiled function as constants,
+        see chemeos.numba.specialize_saturation_pressure. If temperature is given
+        the set covering it is used, otherwise species_name must have only one set.
+        The function returns nan for temperatures outside of that set's range.
+
+        Note: Requires numba, raises ImportError if it is not installed.
+        """
+
+        from chemeos.numba import specialize_saturation_pressure
+
+        rec = self._only_rec(species_name) if temperature is None else\
+            self._resolve(species_name,temperature)
+
+        return specialize_saturation_pressure(rec.A,rec.B,rec.C,rec.Tlo,rec.Thi,self.is_log10)
+
+    def _only_rec(self,species_name):
+        """Returns the AntoineRecord of a species with a single set of coefficients."""
+
+        if species_name not in self.antoine_coeff_lib:
+            raise SpeciesNotFound(str(species_name) + " is not in this dictionary")
+
+        records = self.antoine_coeff_lib[species_name]
+
+        if len(records) != 1:
+
+            raise ValueError(str(species_name) + " has " + str(len(records)) +\
+                " sets of coefficients, pass a temperature to choose one.")
+
+        return records[0]
+
+    def get_saturation_pressure_many(self,species_names,temperatures,dtype = np.float64):
+        """Returns a numpy array of saturation pressures for parallel arrays of\
+         species names and temperatures.
+
+        Parameters
+
+            - species_names: array-like of species names.
+            - temperatures: array-like of temperatures, the same length as species_names.
+            - dtype: the floating point type the evaluation is done in, see saturation_pressure.
+
+        Notes
+
+            - Points are grouped by species so the coefficient lookup is done once per
+                unique species rather than once per point.
+            - A single TemperatureOutOfRange is raised listing the indices of every
+                temperature not covered by a set of coefficients.
+
+        """
+
+        species_names = np.asarray(species_names)
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+
+        if species_names.shape != temperatures.shape:
+
+            raise ValueError("species_names and temperatures must be the same shape.")
+
+        unique_names, inverse = np.unique(species_names, return_inverse=True)
+        inverse = inverse.reshape(species_names.shape)
+
+        failed = np.zeros(temperatures.shape, dtype=bool)
+        groups = []
+
+        # Every point's row is selected before any are evaluated, so nothing is evaluated
+        # with the placeholder row of an uncovered temperature.
+        for group, species_name in enumerate(unique_names.tolist()):
+
+            if species_name not in self.antoine_coeff_lib:
+
+                raise SpeciesNotFound(str(species_name) + " is not in this dictionary")
+
+            in_group = inverse == group
+            temp = temperatures[in_group]
+
+            selected, valid = self._covering_rows(species_name,temp)
+
+            failed[in_group] = ~valid
+            groups.append((in_group,selected,temp))
+
+        if np.any(failed):
+
+            raise TemperatureOutOfRange("There is no availible set of coefficients\
+             for the temperatures at indices " + str(np.flatnonzero(failed).tolist()) + ".")
 
-        coeffs = self.get_coeffs(species_name,temperature)
+        pressures = np.empty(temperatures.shape, dtype=dtype)
 
-        if _check_temperature(temperature,coeffs) is False:
+        for in_group, selected, temp in groups:
 
-            raise TemperatureOutOfRange()
+            pressures[in_group] = saturation_pressure(self._A[selected],self._B[selected],\
+                self._C[selected],temp,self.is_log10,dtype)
 
-        return saturation_pressure(coeffs[_COEFF_A_KEY],coeffs[_COEFF_B_KEY],\
-            coeffs[_COEFF_C_KEY],temperature,self.is_log10)
+        return pressures
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+import numpy as np
+from numba import njit, vectorize, float32, float64
+
+# JIT compiled Antoine kernels, requires numba to be installed.
+
+# The ufuncs are compiled for float64 and float32 so both evaluation precisions stay native.
+_UFUNC_SIGNATURES = [float64(float64,float64,float64,float64),
+    float32(float32,float32,float32,float32)]
+
+@njit(cache=True, fastmath=True)
+def _sat_p_log10(coeff_a_val,coeff_b_val,coeff_c_val,temp):
+    """Saturation pressure for coefficients fit with log base 10."""
+
+    return 10.0**(coeff_a_val - coeff_b_val/(coeff_c_val + temp))
+
+@njit(cache=True, fastmath=True)
+def _sat_p_ln(coeff_a_val,coeff_b_val,coeff_c_val,temp):
+    """Saturation pressure for coefficients fit with the natural log."""
+
+    return np.exp(coeff_a_val - coeff_b_val/(coeff_c_val + temp))
+
+@njit(cache=True, fastmath=True)
+def saturation_pressure_nb(coeff_a_val,coeff_b_val,coeff_c_val,temp,is_log10 = True):
+    """JIT compiled scalar version of antoine.saturation_pressure.
+
+    Parameters
+        - coeff_a_val is Antoine coefficient A.
+        - coeff_b_val is Antoine coefficient B.
+        - coeff_c_val is Antoine coefficient C.
+        - temp is the temperature
+    Note: It is the users responsibility to ensure units are consistent.
+    """
+
+    if is_log10:
+
+        return _sat_p_log10(coeff_a_val,coeff_b_val,coeff_c_val,temp)
+
+    return _sat_p_ln(coeff_a_val,coeff_b_val,coeff_c_val,temp)
+
+@vectorize(_UFUNC_SIGNATURES, target='parallel', fastmath=True)
+def sat_p_vec_log10(coeff_a_val,coeff_b_val,coeff_c_val,temp):
+    """Broadcasting ufunc of the log base 10 saturation pressure."""
+
+    return 10.0**(coeff_a_val - coeff_b_val/(coeff_c_val + temp))
+
+@vectorize(_UFUNC_SIGNATURES, target='parallel', fastmath=True)
+def sat_p_vec_ln(coeff_a_val,coeff_b_val,coeff_c_val,temp):
+    """Broadcasting ufunc of the natural log saturation pressure."""
+
+    return np.exp(coeff_a_val - coeff_b_val/(coeff_c_val + temp))
+
+# Drop in broadcasting ufunc for log base 10 coefficients, accepts any broadcastable mix of
+# scalars and arrays for A, B, C and the temperature, unlike np.vectorize it is compiled.
+antoine_pressure_ufunc = sat_p_vec_log10
+
+def specialize_saturation_pressure(coeff_a_val,coeff_b_val,coeff_c_val,\
+    lower_temperature_limit_val,upper_temperature_limit_val,is_log10 = True):
+    """Returns a JIT compiled function of temperature with one set of coefficients\
+     baked in as constants.
+
+    The coefficients and limits are captured as Python floats, numba folds them into
+    the compiled code as constants. The function returns nan for a temperature
+    outside of the limits, or nan, and follows numpy's floating point rules (e.g.
+    inf rather than ZeroDivisionError). fastmath is not used as it assumes there are
+    no nans. Closures are not cached between sessions.
+    """
+
+    coeff_a_val = float(coeff_a_val)
+    coeff_b_val = float(coeff_b_val)
+    coeff_c_val = float(coeff_c_val)
+    lower = float(lower_temperature_limit_val)
+    upper = float(upper_temperature_limit_val)
+
+    if is_log10:
+
+        @njit(error_model='numpy')
+        def specialized(temp):
+
+            if temp < lower or temp > upper:
+
+                return np.nan
+
+            return 10.0**(coeff_a_val - coeff_b_val/(coeff_c_val + temp))
+
+    else:
+
+        @njit(error_model='numpy')
+        def specialized(temp):
+
+            if temp < lower or temp > upper:
+
+                return np.nan
+
+            return np.exp(coeff_a_val - coeff_b_val/(coeff_c_val + temp))
+
+    return specialized
@@ -0,0 +1,263 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+import chemeos.antoine as an
+
+METHANOL_A = 8.08097
+METHANOL_B = 1582.271
+METHANOL_C = 239.726
+
+def _exact(temp):
+    return 10**(METHANOL_A - METHANOL_B/(METHANOL_C + temp))
+
+def _nested_lib():
+    """A species whose second range lies inside its first."""
+
+    lib = an.AntoineCoefficientLib("Celsius","mmHg","test")
+    lib.add_coefficients("x",METHANOL_A,METHANOL_B,METHANOL_C,0,100)
+    lib.add_coefficients("x",1.0,1.0,1.0,10,20)
+
+    return lib
+
+def _overlapping_lib():
+    """A species with two ranges overlapping over [50, 60]."""
+
+    lib = an.AntoineCoefficientLib("Celsius","mmHg","test")
+    lib.add_coefficients("x",METHANOL_A,METHANOL_B,METHANOL_C,0,60)
+    lib.add_coefficients("x",8.0,1500.0,230.0,50,100)
+
+    return lib
+
+def test_nested_ranges_scalar():
+    lib = _nested_lib()
+
+    assert lib.get_saturation_pressure("x",50.0) == pytest.approx(_exact(50.0))
+    assert lib.get_a("x",50.0) == METHANOL_A
+
+def test_nested_ranges_array():
+    lib = _nested_lib()
+
+    pressures = lib.get_saturation_pressure("x",np.array([50.0,90.0]))
+
+    np.testing.assert_allclose(pressures,_exact(np.array([50.0,90.0])))
+
+def test_out_of_range_raises():
+    lib = _nested_lib()
+
+    with pytest.raises(an.TemperatureOutOfRange):
+        lib.get_saturation_pressure("x",150.0)
+
+    with pytest.raises(an.TemperatureOutOfRange):
+        lib.get_saturation_pressure("x",np.array([50.0,150.0]))
+
+def test_overlapping_ranges_use_first_added():
+    lib = _overlapping_lib()
+
+    assert lib.get_saturation_pressure("x",55.0) == pytest.approx(_exact(55.0))
+    np.testing.assert_allclose(lib.get_saturation_pressure("x",np.array([55.0])),\
+        _exact(np.array([55.0])))
+    assert lib.get_a("x",70.0) == 8.0
+
+def test_many_matches_single_species_lookups():
+    nested = _nested_lib()
+    overlapping = _overlapping_lib()
+
+    np.testing.assert_allclose(nested.get_saturation_pressure_many(["x"],[50.0]),\
+        [nested.get_saturation_pressure("x",50.0)])
+    np.testing.assert_allclose(overlapping.get_saturation_pressure_many(["x","x"],[55.0,70.0]),\
+        overlapping.get_saturation_pressure("x",np.array([55.0,70.0])))
+
+    with pytest.raises(an.TemperatureOutOfRange):
+        nested.get_saturation_pressure_many(["x","x"],[50.0,150.0])
+
+def test_copies_have_independent_lookups():
+    lib = _nested_lib()
+    lib.get_saturation_pressure("x",50.0)
+
+    duplicate = copy.deepcopy(lib)
+    duplicate.add_coefficients("y",METHANOL_A,METHANOL_B,METHANOL_C,0,100)
+
+    assert duplicate.get_saturation_pressure("y",50.0) == pytest.approx(_exact(50.0))
+
+    with pytest.raises(an.SpeciesNotFound):
+        lib.get_saturation_pressure("y",50.0)
+
+    restored = pickle.loads(pickle.dumps(lib))
+
+    assert restored.get_saturation_pressure("x",50.0) == pytest.approx(_exact(50.0))
+
+def test_zero_dimensional_temperature():
+    lib = _nested_lib()
+
+    assert lib.get_saturation_pressure("x",np.array(50.0)) == pytest.approx(_exact(50.0))
+    assert lib.get_a("x",np.array(50.0)) == METHANOL_A
+
+def test_read_only_inputs():
+    temps = np.array([20.0,50.0])
+    temps.flags.writeable = False
+    coeff_a = np.broadcast_to(METHANOL_A,temps.shape)
+
+    pressures = an.saturation_pressure(coeff_a,np.full(2,METHANOL_B),np.full(2,METHANOL_C),temps)
+
+    np.testing.assert_allclose(pressures,_exact(temps))
+
+def test_compiled_evaluator_nan_and_range():
+    pytest.importorskip("numba")
+
+    lib = _nested_lib()
+    evaluator = lib.compile_evaluator("x",50.0)
+
+    assert evaluator(50.0) == pytest.approx(_exact(50.0))
+    assert np.isnan(evaluator(np.nan))
+    assert np.isnan(evaluator(150.0))
+
+def test_evaluator_out_of_range_is_quiet_nan():
+    lib = an.AntoineCoefficientLib("Celsius","mmHg","test")
+    lib.add_coefficients("x",METHANOL_A,METHANOL_B,METHANOL_C,0,100)
+    evaluator = lib.make_evaluator("x")
+
+    with np.errstate(all="raise"):
+        pressures = evaluator(np.array([-METHANOL_C,50.0,1e6]))
+
+    assert np.isnan(pressures[0]) and np.isnan(pressures[2])
+    assert pressures[1] == pytest.approx(_exact(50.0))
+    assert evaluator(50.0) == pytest.approx(_exact(50.0))
+
+    with pytest.raises(an.SpeciesNotFound):
+        lib.make_evaluator(1)
+
+def test_scalar_path_returns_float():
+    pressure = an.saturation_pressure(METHANOL_A,METHANOL_B,METHANOL_C,50.0)
+
+    assert type(pressure) is float
+    assert pressure == pytest.approx(_exact(50.0))
+    assert type(an.saturation_pressure(1,1,1,1,False)) is float
+    assert an.saturation_pressure(1,1,1,1,False) == pytest.approx(np.exp(0.5))
+
+def test_sequence_coefficients_with_scalar_temperature():
+    pressures = an.saturation_pressure([8.0,8.1],1582.0,240.0,50.0)
+
+    np.testing.assert_allclose(pressures,10**(np.array([8.0,8.1]) - 1582.0/290.0))
+
+def test_log_natural_and_base_10():
+    lib_ln = an.AntoineCoefficientLib("Celsius","mmHg","test",is_log10=False)
+    lib_log10 = an.AntoineCoefficientLib("Celsius","mmHg","test")
+
+    assert lib_ln._log(np.e) == pytest.approx(1.0)
+    np.testing.assert_allclose(lib_ln._log(np.array([1.0,np.e])),[0.0,1.0])
+    assert lib_log10._log(100.0) == pytest.approx(2.0)
+    np.testing.assert_allclose(lib_log10._log(np.array([1.0,100.0])),[0.0,2.0])
+
+def test_array_lookup_sees_coefficients_added_after_first_use():
+    lib = an.AntoineCoefficientLib("Celsius","mmHg","test")
+    lib.add_coefficients("methanol",METHANOL_A,METHANOL_B,METHANOL_C,0.0,60.0)
+    lib.get_saturation_pressure("methanol",np.array([10.0,20.0]))
+
+    lib.add_coefficients("methanol",8.0,1500.0,230.0,61.0,100.0)
+
+    np.testing.assert_allclose(lib.get_saturation_pressure("methanol",np.array([10.0,80.0])),\
+        [_exact(10.0),10**(8.0 - 1500.0/310.0)])
+
+def test_array_lookup_with_ranges_added_out_of_order():
+    lib = an.AntoineCoefficientLib("Celsius","mmHg","test")
+    lib.add_coefficients("methanol",8.0,1500.0,230.0,61.0,100.0)
+    lib.add_coefficients("methanol",METHANOL_A,METHANOL_B,METHANOL_C,0.0,60.0)
+    temperature = np.array([-5.0,10.0,60.5,80.0,np.nan,150.0])
+
+    selected, valid = lib._covering_rows("methanol",temperature)
+
+    np.testing.assert_array_equal(valid,[False,True,False,True,False,False])
+    np.testing.assert_array_equal(selected[valid],[1,0])
+    assert [lib.get_saturation_pressure("methanol",t) for t in (10.0,80.0)] ==\
+        pytest.approx(lib.get_saturation_pressure("methanol",np.array([10.0,80.0])))
+
+@pytest.mark.parametrize("make_lib",[_nested_lib,_overlapping_lib])
+def test_evaluator_matches_scalar_lookup(make_lib):
+    lib = make_lib()
+    species_name = next(iter(lib.antoine_coeff_lib))
+    evaluator = lib.make_evaluator(species_name)
+    temperature = np.array([0.0,5.0,15.0,55.0,60.0,75.0,100.0])
+
+    expected = [lib.get_saturation_pressure(species_name,t) for t in temperature.tolist()]
+
+    assert [evaluator(t) for t in temperature.tolist()] == pytest.approx(expected)
+    np.testing.assert_allclose(evaluator(temperature),expected)
+    assert np.isnan(evaluator(-1.0)) and np.isnan(evaluator(101))
+
+def test_single_range_evaluator():
+    lib = an.AntoineCoefficientLib("Celsius","mmHg","test")
+    lib.add_coefficients("methanol",METHANOL_A,METHANOL_B,METHANOL_C,0.0,60.0)
+    evaluator = lib.make_evaluator("methanol")
+
+    assert type(evaluator(50.0)) is float
+    assert evaluator(50.0) == pytest.approx(_exact(50.0))
+    np.testing.assert_allclose(evaluator(np.array([10.0,70.0])),[_exact(10.0),np.nan])
+
+def test_many_out_of_range_does_not_evaluate():
+    lib = _nested_lib()
+
+    # -C makes the fallback row divide by zero, it must be reported as out of range.
+    with np.errstate(all="raise"):
+        with pytest.raises(an.TemperatureOutOfRange,match=r"\[1\]"):
+            lib.get_saturation_pressure_many(["x","x"],[50.0,-METHANOL_C])
+
+def test_float32_evaluation():
+    temps = np.linspace(0.0,60.0,7)
+
+    pressures = an.saturation_pressure(METHANOL_A,METHANOL_B,METHANOL_C,temps,dtype=np.float32)
+
+    assert pressures.dtype == np.float32
+    np.testing.assert_allclose(pressures,_exact(temps),rtol=2e-6)
+
+    lib = _overlapping_lib()
+    many = lib.get_saturation_pressure_many(["x"]*temps.size,temps,dtype=np.float32)
+
+    assert many.dtype == np.float32
+    np.testing.assert_allclose(many,lib.get_saturation_pressure("x",temps),rtol=2e-6)
+
+def test_coefficients_broadcast_against_temperatures():
+    coeff_a = np.array([[METHANOL_A],[8.0]])
+    temps = np.array([10.0,20.0,30.0])
+
+    pressures = an.saturation_pressure(coeff_a,METHANOL_B,METHANOL_C,temps)
+
+    assert pressures.shape == (2,3)
+    np.testing.assert_allclose(pressures[0],_exact(temps))
+    np.testing.assert_allclose(pressures[1],10**(8.0 - METHANOL_B/(METHANOL_C + temps)))
+
+def test_exp_ln10_matches_power_of_10():
+    exponents = np.linspace(-10.0,10.0,201)
+
+    np.testing.assert_allclose(an._pow10_array(exponents),10.0**exponents,rtol=1e-13)
+    assert an._pow10(2.5) == pytest.approx(10.0**2.5,rel=1e-15)
+
+    temps = np.linspace(-50.0,200.0,26)
+    np.testing.assert_allclose(an.saturation_pressure(METHANOL_A,METHANOL_B,METHANOL_C,temps),\
+        _exact(temps),rtol=1e-13)
+
+def test_numba_kernels():
+    nb = pytest.importorskip("chemeos.numba")
+
+    assert nb.saturation_pressure_nb(METHANOL_A,METHANOL_B,METHANOL_C,50.0) ==\
+        pytest.approx(_exact(50.0))
+    assert nb.saturation_pressure_nb(1.0,1.0,1.0,1.0,False) == pytest.approx(np.exp(0.5))
+    np.testing.assert_allclose(nb.sat_p_vec_ln(1.0,1.0,1.0,np.array([1.0,3.0])),\
+        np.exp([0.5,0.75]))
+
+def test_antoine_pressure_ufunc():
+    nb = pytest.importorskip("chemeos.numba")
+    temps = np.linspace(0.0,60.0,7)
+
+    pressures = nb.antoine_pressure_ufunc(METHANOL_A,METHANOL_B,METHANOL_C,temps)
+
+    assert pressures.dtype == np.float64
+    np.testing.assert_allclose(pressures,_exact(temps))
+
+    pressures_32 = nb.antoine_pressure_ufunc(np.float32(METHANOL_A),np.float32(METHANOL_B),\
+        np.float32(METHANOL_C),temps.astype(np.float32))
+
+    assert pressures_32.dtype == np.float32
+    np.testing.assert_allclose(pressures_32,_exact(temps),rtol=1e-5)